@@ -6,8 +6,12 @@
 # License-Filename: LICENSE
 
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import numpy as np
+
 import bpy
-from mathutils import Vector
 from bpy.props import FloatProperty, EnumProperty, BoolProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
@@ -25,6 +29,14 @@ if FreeCAD is None and scipy is None:
 if FreeCAD is not None:
     from FreeCAD import Base
 
+# Available implementations do not change at runtime, so the list is built once.
+# It is also important to keep a reference to this list for Blender's EnumProperty.
+_implementations = []
+if FreeCAD is not None:
+    _implementations.append(('FREECAD', "FreeCAD", "Implementation from FreeCAD library", 0))
+if scipy is not None:
+    _implementations.append(('SCIPY', "SciPy", "Sverchok built-in implementation", 1))
+
 class SvIntersectNurbsCurvesNode(bpy.types.Node, SverchCustomTreeNode):
     """
     Triggers: Intersect Curves
@@ -36,16 +48,7 @@ class SvIntersectNurbsCurvesNode(bpy.types.Node, SverchCustomTreeNode):
     sv_icon = 'SV_INTERSECT_CURVES'
 
     def get_implementations(self, context):
-        result = []
-        if FreeCAD is not None:
-            item = ('FREECAD', "FreeCAD", "Implementation from FreeCAD library", 0)
-            result.append(item)
-        
-        if scipy is not None:
-            item = ('SCIPY', "SciPy", "Sverchok built-in implementation", 1)
-            result.append(item)
-
-        return result
+        return _implementations
 
     implementation : EnumProperty(
             name = "Implementation",
@@ -99,6 +102,12 @@ class SvIntersectNurbsCurvesNode(bpy.types.Node, SverchCustomTreeNode):
             default = True,
             update = updateNode)
 
+    output_numpy : BoolProperty(
+            name = "Output NumPy",
+            description = "Output NumPy arrays (improves performance)",
+            default = False,
+            update = updateNode)
+
     def draw_buttons(self, context, layout):
         layout.prop(self, 'implementation', text='')
         layout.prop(self, 'matching')
@@ -112,6 +121,7 @@ class SvIntersectNurbsCurvesNode(bpy.types.Node, SverchCustomTreeNode):
         if self.implementation == 'SCIPY':
             layout.prop(self, 'precision')
             layout.prop(self, 'method')
+        layout.prop(self, 'output_numpy')
 
     def sv_init(self, context):
         self.inputs.new('SvCurveSocket', "Curve1")
@@ -122,42 +132,98 @@ class SvIntersectNurbsCurvesNode(bpy.types.Node, SverchCustomTreeNode):
 
     def _filter(self, points):
         if not points:
-            return [], [], []
-
-        t1, t2, prev = points[0]
-        out_t1 = [t1]
-        out_t2 = [t2]
-        out_points = [prev]
-        for t1, t2, p in points[1:]:
-            r = (Vector(p) - Vector(prev)).length
-            if r > 1e-4:
-                out_t1.append(t1)
-                out_t2.append(t2)
-                out_points.append(p)
-            prev = p
-        return out_t1, out_t2, out_points
-
-    def process_native(self, curve1, curve2):
+            return np.empty((0,)), np.empty((0,)), np.empty((0,3))
+
+        t1s, t2s, pts = zip(*points)
+        t1s = np.asarray(t1s, dtype=np.float64)
+        t2s = np.asarray(t2s, dtype=np.float64)
+        pts = np.asarray(pts, dtype=np.float64)
+
+        # Drop points which are too close to previous ones;
+        # all distances are calculated at once, without branching.
+        dists = np.linalg.norm(pts[1:] - pts[:-1], axis=1)
+        good = np.concatenate(([True], dists > 1e-4))
+        return t1s[good], t2s[good], pts[good]
+
+    def process_native(self, curve1, curve2, method, precision, logger, max_results=None):
+        # This is called from worker threads, so it must not
+        # access node properties; all settings are passed explicitly.
         res = intersect_nurbs_curves(curve1, curve2,
-                    method = self.method,
-                    numeric_precision = self.precision,
-                    logger = self.get_logger())
-        points = [(r[0], r[1], r[2].tolist()) for r in res]
-        return self._filter(points)
-
-    def process_freecad(self, sv_curve1, sv_curve2):
-        fc_curve1 = curve_to_freecad(sv_curve1)[0]
-        fc_curve2 = curve_to_freecad(sv_curve2)[0]
+                    method = method,
+                    numeric_precision = precision,
+                    logger = logger,
+                    max_results = max_results)
+        return self._filter(res)
+
+    def process_freecad(self, fc_curve1, fc_curve2, max_results=None):
         points = fc_curve1.curve.intersectCC(fc_curve2.curve)
-        points = [(p.X, p.Y, p.Z) for p in points]
+        if max_results is not None:
+            points = points[:max_results]
 
         pts = []
         for p in points:
-            t1 = fc_curve1.curve.parameter(Base.Vector(*p))
-            t2 = fc_curve2.curve.parameter(Base.Vector(*p))
+            p = (p.X, p.Y, p.Z)
+            # Build FreeCAD vector once for both curves
+            fc_point = Base.Vector(*p)
+            t1 = fc_curve1.curve.parameter(fc_point)
+            t2 = fc_curve2.curve.parameter(fc_point)
             pts.append((t1, t2, p))
         return self._filter(pts)
 
+    def _get_cached(self, cache, curve, function):
+        key = id(curve)
+        if key not in cache:
+            # Keep a reference to the curve itself, so that it's id can not be reused.
+            cache[key] = (curve, function(curve))
+        return cache[key][1]
+
+    def _to_nurbs(self, nurbs_cache, curve, input_name):
+        nurbs = self._get_cached(nurbs_cache, curve, SvNurbsCurve.to_nurbs)
+        if nurbs is None:
+            raise Exception(f"{input_name} is not a NURBS")
+        return nurbs
+
+    def _get_bbox(self, bbox_cache, curve):
+        # Bounding box of NURBS curve's control points contains the curve.
+        return self._get_cached(bbox_cache, curve,
+                    lambda c: c.get_bounding_box().increase(self.precision))
+
+    def _get_max_results(self):
+        # In "single" mode, all intersections except the first one
+        # are discarded anyway, so there is no need to search for them.
+        if self.single:
+            return 1
+        else:
+            return None
+
+    def _solve_native(self, pairs):
+        solve = partial(self.process_native,
+                    method = self.method,
+                    precision = self.precision,
+                    logger = self.get_logger(),
+                    max_results = self._get_max_results())
+        if len(pairs) < 2:
+            return [solve(curve1, curve2) for curve1, curve2 in pairs]
+        # Pairs of curves are independent, so they can be processed in parallel.
+        # But the same curve object can appear in many pairs, and curve evaluation
+        # is not thread-safe (SvNurbsBasisFunctions caches intermediate values
+        # in the curve object); so each task gets its own copies of curves.
+        pairs = [(curve1.copy(), curve2.copy()) for curve1, curve2 in pairs]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(lambda pair: solve(*pair), pairs))
+
+    def _solve_freecad(self, pairs, freecad_cache):
+        # FreeCAD library is not guaranteed to be thread-safe,
+        # so FreeCAD implementation is always single-threaded.
+        to_freecad = lambda c: curve_to_freecad(c)[0]
+        max_results = self._get_max_results()
+        results = []
+        for curve1, curve2 in pairs:
+            fc_curve1 = self._get_cached(freecad_cache, curve1, to_freecad)
+            fc_curve2 = self._get_cached(freecad_cache, curve2, to_freecad)
+            results.append(self.process_freecad(fc_curve1, fc_curve2, max_results=max_results))
+        return results
+
     def match(self, curves1, curves2):
         if self.matching == 'LONG':
             return zip_long_repeat(curves1, curves2)
@@ -178,25 +244,56 @@ class SvIntersectNurbsCurvesNode(bpy.types.Node, SverchCustomTreeNode):
         t1_out = []
         t2_out = []
 
+        nurbs_cache = dict()
+        bbox_cache = dict()
+        freecad_cache = dict()
+
         for curve1s, curve2s in zip_long_repeat(curve1_s, curve2_s):
-            new_points = []
-            new_t1 = []
-            new_t2 = []
+            # Convert each curve once, not once per pair
+            curve1s = [self._to_nurbs(nurbs_cache, curve, "Curve1") for curve in curve1s]
+            curve2s = [self._to_nurbs(nurbs_cache, curve, "Curve2") for curve in curve2s]
+
+            results = []
+            pairs_to_solve = []
+
             for curve1, curve2 in self.match(curve1s, curve2s):
-                curve1 = SvNurbsCurve.to_nurbs(curve1)
-                if curve1 is None:
-                    raise Exception("Curve1 is not a NURBS")
-                curve2 = SvNurbsCurve.to_nurbs(curve2)
-                if curve2 is None:
-                    raise Exception("Curve2 is not a NURBS")
-
-                if self.implementation == 'SCIPY':
-                    t1s, t2s, ps = self.process_native(curve1, curve2)
+                bbox1 = self._get_bbox(bbox_cache, curve1)
+                bbox2 = self._get_bbox(bbox_cache, curve2)
+                if not bbox1.intersects(bbox2):
+                    # Curves can not intersect, no need to call the solver
+                    results.append(self._filter([]))
                 else:
-                    t1s, t2s, ps = self.process_freecad(curve1, curve2)
-
+                    # Placeholder, to be filled when the solver is done
+                    results.append(None)
+                    pairs_to_solve.append((len(results)-1, (curve1, curve2)))
+
+            pairs = [pair for _, pair in pairs_to_solve]
+            if self.implementation == 'SCIPY':
+                solved = self._solve_native(pairs)
+            else:
+                solved = self._solve_freecad(pairs, freecad_cache)
+            for (idx, _), result in zip(pairs_to_solve, solved):
+                results[idx] = result
+
+            # In Cross mode, pairs are ordered by curve2, then by curve1;
+            # with "split", points and T2 are grouped by curve2 index,
+            # while T1 is grouped by curve1 index.
+            split_cross = self.split and self.matching == 'CROSS'
+            if split_cross:
+                n = len(curve1s)
+                n_rows = len(results) // n if n else 0
+                n_cols = n if results else 0
+                new_points = [[] for _ in range(n_rows)]
+                new_t1 = [[] for _ in range(n_cols)]
+                new_t2 = [[] for _ in range(n_rows)]
+            else:
+                new_points = []
+                new_t1 = []
+                new_t2 = []
+
+            for i, (t1s, t2s, ps) in enumerate(results):
                 if self.check_intersection:
-                    if not ps:
+                    if len(ps) == 0:
                         raise Exception("Some curves do not intersect!")
 
                 if self.single:
@@ -205,11 +302,22 @@ class SvIntersectNurbsCurvesNode(bpy.types.Node, SverchCustomTreeNode):
                         t1s = t1s[0]
                         t2s = t2s[0]
 
-                new_points.append(ps)
-                new_t1.append(t1s)
-                new_t2.append(t2s)
+                if not self.output_numpy:
+                    ps = ps.tolist()
+                    t1s = t1s.tolist()
+                    t2s = t2s.tolist()
+
+                if split_cross:
+                    curve2_idx, curve1_idx = divmod(i, n)
+                    new_points[curve2_idx].append(ps)
+                    new_t1[curve1_idx].append(t1s)
+                    new_t2[curve2_idx].append(t2s)
+                else:
+                    new_points.append(ps)
+                    new_t1.append(t1s)
+                    new_t2.append(t2s)
 
-            if self.split:
+            if self.split and not split_cross:
                 n = len(curve1s)
                 new_points = split_by_count(new_points, n)
                 new_t1 = split_by_count(new_t1, n)
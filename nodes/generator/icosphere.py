@@ -17,6 +17,8 @@
 # ##### END GPL LICENSE BLOCK #####
 
 from math import pi, sqrt
+import numpy as np
+
 import bpy
 from bpy.props import IntProperty, FloatProperty, BoolVectorProperty
 import bmesh
@@ -25,7 +27,6 @@ from mathutils import Matrix, Vector
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 from sverchok.utils.sv_bmesh_utils import numpy_data_from_bmesh
-from sverchok.utils.math import from_cylindrical
 from sverchok.utils.nodes_mixins.recursive_nodes import SvRecursiveNode
 
 
@@ -75,11 +76,46 @@ def icosahedron_cylindrical(r):
 
     return vertices, edges, faces
 
-def icosahedron(r):
-    vertices, edges, faces = icosahedron_cylindrical(r)
-    vertices = [from_cylindrical(rho, phi, z, 'radians') for rho, phi, z in vertices]
+def _unit_icosahedron():
+    _, edges, faces = icosahedron_cylindrical(1.0)
+
+    # Same vertices as in icosahedron_cylindrical(), but directly in cartesian coordinates
+    d = 2.0/sqrt(5)
+    upper = np.arange(5) * 2*pi/5 + pi/5
+    lower = np.arange(5) * 2*pi/5
+    vertices = np.concatenate((
+            [(0, 0, 1)],
+            np.stack((d*np.cos(upper), d*np.sin(upper), np.full(5, 0.5*d))).T,
+            np.stack((d*np.cos(lower), d*np.sin(lower), np.full(5, -0.5*d))).T,
+            [(0, 0, -1)]
+        ))
+    edges = tuple(tuple(edge) for edge in edges)
+    faces = tuple(tuple(face) for face in faces)
     return vertices, edges, faces
 
+# Icosahedron topology does not depend on radius,
+# so it is calculated only once at module load.
+_ICO_VERTS, _ICO_EDGES, _ICO_FACES = _unit_icosahedron()
+
+def icosahedron(r):
+    # Fresh lists every time, the same as for subdivided icospheres
+    edges = [list(edge) for edge in _ICO_EDGES]
+    faces = [list(face) for face in _ICO_FACES]
+    return (_ICO_VERTS * r).tolist(), edges, faces
+
+def unit_icosphere(bm, subdivisions):
+    """
+    Build an icosphere of radius 1 in the provided (empty) bmesh.
+    Returns: vertices, edges and faces as NumPy arrays.
+    """
+    bmesh.ops.create_icosphere(
+        bm,
+        subdivisions=subdivisions,
+        diameter=1.0)
+    # numpy_data_from_bmesh copies the data, so it is safe to clear bm later
+    verts, edges, faces, _ = numpy_data_from_bmesh(bm, (True, True, True))
+    return verts, edges, faces
+
 class SvIcosphereNode(bpy.types.Node, SverchCustomTreeNode, SvRecursiveNode):
     "IcoSphere primitive"
 
@@ -154,12 +190,21 @@ class SvIcosphereNode(bpy.types.Node, SverchCustomTreeNode, SvRecursiveNode):
         out_verts = []
         out_edges = []
         out_faces = []
-
+        # Icospheres with the same number of subdivisions differ only by scale,
+        # so unit icospheres are cached by number of subdivisions.
+        unit_icospheres = dict()
+        bm = None
 
         for subdivisions, radius in zip(*params):
             if subdivisions == 0:
                 # In this case we just return the icosahedron
                 verts, edges, faces = icosahedron(radius)
+                if self.out_np[0]:
+                    verts = np.array(verts)
+                if self.out_np[1]:
+                    edges = np.array(edges)
+                if self.out_np[2]:
+                    faces = np.array(faces)
                 out_verts.append(verts)
                 out_edges.append(edges)
                 out_faces.append(faces)
@@ -168,19 +213,26 @@ class SvIcosphereNode(bpy.types.Node, SverchCustomTreeNode, SvRecursiveNode):
             if subdivisions > self.subdivisions_max:
                 subdivisions = self.subdivisions_max
 
-            bm = bmesh.new()
-            bmesh.ops.create_icosphere(
-                bm,
-                subdivisions=subdivisions,
-                diameter=radius)
+            if subdivisions not in unit_icospheres:
+                if bm is None:
+                    bm = bmesh.new()
+                else:
+                    bm.clear()
+                unit_icospheres[subdivisions] = unit_icosphere(bm, subdivisions)
 
-            verts, edges, faces, _ = numpy_data_from_bmesh(bm, self.out_np)
-            bm.free()
+            # Each output gets its own data, so that downstream nodes can modify it in place
+            unit_verts, edges, faces = unit_icospheres[subdivisions]
+            verts = unit_verts * radius
+            verts = verts if self.out_np[0] else verts.tolist()
+            edges = edges.copy() if self.out_np[1] else edges.tolist()
+            faces = faces.copy() if self.out_np[2] else faces.tolist()
 
             out_verts.append(verts)
             out_edges.append(edges)
             out_faces.append(faces)
 
+        if bm is not None:
+            bm.free()
         return out_verts, out_edges, out_faces
 
 
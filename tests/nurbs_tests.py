@@ -9,11 +9,11 @@ from sverchok.utils.geom import circle_by_three_points
 from sverchok.utils.curve import knotvector as sv_knotvector
 from sverchok.utils.curve.primitives import SvCircle
 from sverchok.utils.curve.nurbs import SvGeomdlCurve, SvNativeNurbsCurve, SvNurbsBasisFunctions, SvNurbsCurve
-from sverchok.utils.curve.nurbs_algorithms import interpolate_nurbs_curve
+from sverchok.utils.curve.nurbs_algorithms import interpolate_nurbs_curve, intersect_nurbs_curves
 from sverchok.utils.nurbs_common import elevate_bezier_degree, from_homogenous
 from sverchok.utils.surface.nurbs import SvGeomdlSurface, SvNativeNurbsSurface
 from sverchok.utils.surface.algorithms import SvCurveLerpSurface
-from sverchok.dependencies import geomdl
+from sverchok.dependencies import geomdl, scipy
 
 if geomdl is not None:
     from geomdl.helpers import basis_function_one, basis_function_ders_one
@@ -698,6 +698,76 @@ class OtherNurbsTests(SverchokTestCase):
         endpoint = nurbs.evaluate(u_max)
         self.assert_sverchok_data_equal(endpoint.tolist(), pt3, precision=6)
 
+    def test_intersect_bezier(self):
+        "Intersection of cubic NURBS curve with a straight line"
+        control_points1 = np.array([[0, 0, 0], [1, 2, 0], [2, -2, 0], [3, 0, 0]], dtype=np.float64)
+        control_points2 = np.array([[0, 1, 0], [3, -1, 0]], dtype=np.float64)
+        knotvector1 = sv_knotvector.generate(3, num_ctrlpts=4)
+        knotvector2 = sv_knotvector.generate(1, num_ctrlpts=2)
+        curve1 = SvNativeNurbsCurve(3, knotvector1, control_points1)
+        curve2 = SvNativeNurbsCurve(1, knotvector2, control_points2)
+
+        result = intersect_nurbs_curves(curve1, curve2, numeric_precision=1e-6)
+        self.assertEqual(len(result), 3)
+        for t1, t2, pt in result:
+            self.assert_numpy_arrays_equal(curve1.evaluate(t1), pt, precision=5)
+            self.assert_numpy_arrays_equal(curve2.evaluate(t2), pt, precision=5)
+
+        ts = [t1 for t1, _, _ in result]
+        expected_ts = [0.2113, 0.5, 0.7887]
+        self.assert_sverchok_data_equal(ts, expected_ts, precision=4)
+
+    def test_intersect_touching_lines(self):
+        "Intersection of two collinear segments with common end point"
+        knotvector = sv_knotvector.generate(1, num_ctrlpts=2)
+        curve1 = SvNativeNurbsCurve(1, knotvector, np.array([[0, 0, 0], [1, 0, 0]], dtype=np.float64))
+        curve2 = SvNativeNurbsCurve(1, knotvector, np.array([[1, 0, 0], [2, 0, 0]], dtype=np.float64))
+
+        result = intersect_nurbs_curves(curve1, curve2)
+        self.assertEqual(len(result), 1)
+        t1, t2, pt = result[0]
+        self.assertAlmostEqual(t1, 1.0)
+        self.assertAlmostEqual(t2, 0.0)
+        self.assert_numpy_arrays_equal(pt, np.array([1, 0, 0]), precision=6)
+
+    def test_intersect_overlapping_lines(self):
+        "Intersection of two overlapping collinear segments"
+        knotvector = sv_knotvector.generate(1, num_ctrlpts=2)
+        curve1 = SvNativeNurbsCurve(1, knotvector, np.array([[0, 0, 0], [2, 0, 0]], dtype=np.float64))
+        curve2 = SvNativeNurbsCurve(1, knotvector, np.array([[1, 0, 0], [3, 0, 0]], dtype=np.float64))
+
+        result = intersect_nurbs_curves(curve1, curve2)
+        self.assertEqual(len(result), 1)
+        t1, t2, pt = result[0]
+        self.assert_numpy_arrays_equal(curve1.evaluate(t1), pt, precision=6)
+        self.assert_numpy_arrays_equal(curve2.evaluate(t2), pt, precision=6)
+
+    def test_intersect_bezier_max_results(self):
+        "Intersection of cubic NURBS curve with a straight line, limited number of results"
+        control_points1 = np.array([[0, 0, 0], [1, 2, 0], [2, -2, 0], [3, 0, 0]], dtype=np.float64)
+        control_points2 = np.array([[0, 1, 0], [3, -1, 0]], dtype=np.float64)
+        curve1 = SvNativeNurbsCurve(3, sv_knotvector.generate(3, num_ctrlpts=4), control_points1)
+        curve2 = SvNativeNurbsCurve(1, sv_knotvector.generate(1, num_ctrlpts=2), control_points2)
+
+        for max_results in [1, 2]:
+            with self.subTest(max_results=max_results):
+                result = intersect_nurbs_curves(curve1, curve2, numeric_precision=1e-6, max_results=max_results)
+                self.assertEqual(len(result), max_results)
+
+    @requires(scipy)
+    def test_intersect_max_results(self):
+        "Intersection of two degree 4 NURBS curves, limited number of results"
+        xs = np.linspace(0, 3, num=6)
+        ys1 = [-1.13, -0.74, -0.53, 0.68, -0.36, -1.24]
+        ys2 = [0.63, -0.8, -0.77, -0.23, 0.47, -2.41]
+        knotvector = sv_knotvector.generate(4, num_ctrlpts=6)
+        curve1 = SvNativeNurbsCurve(4, knotvector, np.stack((xs, ys1, np.zeros(6))).T)
+        curve2 = SvNativeNurbsCurve(4, knotvector, np.stack((xs, ys2, np.zeros(6))).T)
+
+        for max_results in [1, 2, 3]:
+            with self.subTest(max_results=max_results):
+                result = intersect_nurbs_curves(curve1, curve2, max_results=max_results)
+                self.assertEqual(len(result), max_results)
 
 class KnotvectorTests(SverchokTestCase):
     def test_to_multiplicity_1(self):
@@ -816,4 +886,3 @@ class InterpolateTests(SverchokTestCase):
         weights = curve.get_weights()
         expected_weights = np.array([1, 3, 1])
         self.assert_numpy_arrays_equal(weights, expected_weights, precision=6)
-
@@ -12,17 +12,46 @@ from mathutils import Vector
 import mathutils.geometry
 
 from sverchok.utils.math import distribute_int
-from sverchok.utils.geom import Spline, linear_approximation, intersect_segment_segment
+from sverchok.utils.geom import Spline, linear_approximation, intersect_segment_segment, bounding_box
 from sverchok.utils.nurbs_common import SvNurbsBasisFunctions, SvNurbsMaths, from_homogenous, CantInsertKnotException
 from sverchok.utils.curve import knotvector as sv_knotvector
 from sverchok.utils.curve.algorithms import unify_curves_degree
 from sverchok.utils.decorators import deprecated
 from sverchok.utils.logging import getLogger
-from sverchok.dependencies import scipy
+from sverchok.dependencies import scipy, numba
 
 if scipy is not None:
     import scipy.optimize
 
+if numba is not None:
+
+    @numba.njit(cache=True, fastmath=True, nogil=True)
+    def _nurbs_evaluate_njit(degree, knotvector, points, t):
+        # De Boor's algorithm on homogenous control points (shape (k, 4)).
+        n = points.shape[0]
+        span = degree
+        while span < n-1 and knotvector[span+1] <= t:
+            span += 1
+        d = np.empty((degree+1, 4))
+        for j in range(degree+1):
+            d[j] = points[j + span - degree]
+        for r in range(1, degree+1):
+            for j in range(degree, r-1, -1):
+                left = knotvector[j + span - degree]
+                denominator = knotvector[j + 1 + span - r] - left
+                if denominator == 0.0:
+                    alpha = 0.0
+                else:
+                    alpha = (t - left) / denominator
+                d[j] = (1.0 - alpha) * d[j-1] + alpha * d[j]
+        return d[degree][:3] / d[degree][3]
+
+    @numba.njit(cache=True, fastmath=True, nogil=True)
+    def _curves_distance_goal_njit(ts, degree1, knotvector1, points1, degree2, knotvector2, points2):
+        p1 = _nurbs_evaluate_njit(degree1, knotvector1, points1, ts[0])
+        p2 = _nurbs_evaluate_njit(degree2, knotvector2, points2, ts[1])
+        return (p2 - p1).max()
+
 def unify_two_curves(curve1, curve2):
     return unify_curves([curve1, curve2])
     #curve1 = curve1.to_knotvector(curve2)
@@ -249,22 +278,24 @@ def _check_is_line(curve, eps=0.001):
     # property states that edges of curve's control polygon determine
     # maximum variation of curve's tangent vector.
 
-    cpts = curve.get_control_points()
+    return _check_is_line_points(curve.get_control_points(), eps)
+
+def _check_is_line_points(cpts, eps=0.001):
+    # Same as _check_is_line(), but for control points of NURBS curve.
     # direction from first to last point of the curve
     direction = cpts[-1] - cpts[0]
     direction /= np.linalg.norm(direction)
 
-    for cpt1, cpt2 in zip(cpts, cpts[1:]):
-        # for each edge of control polygon,
-        # check that it constitutes a small enough
-        # angle with `direction`. If not, this is
-        # clearly not a straight line.
-        dv = cpt2 - cpt1
-        dv /= np.linalg.norm(dv)
-        angle = np.arccos(np.dot(dv, direction))
-        if angle > eps:
-            #print(f"A: {direction} x {dv} => {angle}")
-            return False
+    # for each edge of control polygon,
+    # check that it constitutes a small enough
+    # angle with `direction`. If not, this is
+    # clearly not a straight line.
+    # All edges are checked at once, as arrays.
+    dvs = cpts[1:] - cpts[:-1]
+    dvs /= np.linalg.norm(dvs, axis=1, keepdims=True)
+    angles = np.arccos(np.clip(dvs @ direction, -1.0, 1.0))
+    if (angles > eps).any():
+        return False
 
     return (cpts[0], cpts[-1])
 
@@ -276,6 +307,33 @@ def intersect_segment_segment_mu(v1, v2, v3, v4):
         return np.array(v)
     return None
 
+def _get_njit_curve_data(curve):
+    degree = curve.get_degree()
+    knotvector = np.ascontiguousarray(curve.get_knotvector(), dtype=np.float64)
+    points = np.ascontiguousarray(curve.get_homogenous_control_points(), dtype=np.float64)
+    if len(knotvector) != len(points) + degree + 1:
+        return None
+    return degree, knotvector, points
+
+def _get_curves_distance_goal(curve1, curve2):
+    # Use Numba-compiled objective function if possible,
+    # since it is called many times by the numeric method.
+    if numba is not None:
+        data1 = _get_njit_curve_data(curve1)
+        data2 = _get_njit_curve_data(curve2)
+        if data1 is not None and data2 is not None:
+            def njit_goal(ts):
+                return _curves_distance_goal_njit(np.asarray(ts, dtype=np.float64), *data1, *data2)
+            return njit_goal
+
+    def goal(ts):
+        p1 = curve1.evaluate(ts[0])
+        p2 = curve2.evaluate(ts[1])
+        r = (p2 - p1).max()
+        return r
+        #return np.array([r, r])
+    return goal
+
 def _intersect_curves_equation(curve1, curve2, method='SLSQP', precision=0.001, logger=None):
     if logger is None:
         logger = getLogger()
@@ -311,12 +369,7 @@ def _intersect_curves_equation(curve1, curve2, method='SLSQP', precision=0.001,
     if r is not None:
         return r
 
-    def goal(ts):
-        p1 = curve1.evaluate(ts[0])
-        p2 = curve2.evaluate(ts[1])
-        r = (p2 - p1).max()
-        return r
-        #return np.array([r, r])
+    goal = _get_curves_distance_goal(curve1, curve2)
 
     mid1 = (t1_min + t1_max) * 0.5
     mid2 = (t2_min + t2_max) * 0.5
@@ -352,12 +405,292 @@ def _intersect_curves_equation(curve1, curve2, method='SLSQP', precision=0.001,
         logger.debug(f"numeric method fail: [{t1_min} - {t1_max}] x [{t2_min} - {t2_max}]: {res.message}")
         return []
 
-def intersect_nurbs_curves(curve1, curve2, method='SLSQP', numeric_precision=0.001, logger=None):
+def _bezier_split(points):
+    # De Casteljau subdivision of Bezier curve's control polygon at t = 0.5
+    left = [points[0]]
+    right = [points[-1]]
+    while len(points) > 1:
+        points = 0.5 * (points[:-1] + points[1:])
+        left.append(points[0])
+        right.append(points[-1])
+    return np.array(left), np.array(right[::-1])
+
+def _bezier_evaluate(points, t):
+    while len(points) > 1:
+        points = (1.0 - t) * points[:-1] + t * points[1:]
+    return points[0]
+
+def _bezier_tangent(points, t):
+    degree = len(points) - 1
+    if degree == 0:
+        return np.zeros(3)
+    return degree * _bezier_evaluate(points[1:] - points[:-1], t)
+
+def _refine_bezier_intersection(points1, points2, precision, u=0.5, v=0.5,
+        u_clamp=(False, False), v_clamp=(False, False), max_iterations=30):
+    # Gauss-Newton iterations to minimize distance between
+    # points of two Bezier curves, starting from (u, v).
+    # The result is accepted only if it lies within [0; 1] for both curves;
+    # intersections outside of these ranges belong to neighbouring pieces.
+    # u_clamp / v_clamp tell if the lower / upper end of the piece is an end
+    # of the whole curve; the parameter is allowed to stop at such an end,
+    # so that curves which nearly touch at their ends are still detected.
+    u_fixed = v_fixed = False
+    for i in range(max_iterations):
+        delta = _bezier_evaluate(points1, u) - _bezier_evaluate(points2, v)
+        tangent1 = _bezier_tangent(points1, u) if not u_fixed else np.zeros(3)
+        tangent2 = _bezier_tangent(points2, v) if not v_fixed else np.zeros(3)
+        jacobian = np.stack((tangent1, - tangent2)).T
+        step = np.linalg.lstsq(jacobian, -delta, rcond=None)[0]
+        u += step[0]
+        v += step[1]
+        if u_clamp[0] and u < 0.0:
+            u, u_fixed = 0.0, True
+        elif u_clamp[1] and u > 1.0:
+            u, u_fixed = 1.0, True
+        if v_clamp[0] and v < 0.0:
+            v, v_fixed = 0.0, True
+        elif v_clamp[1] and v > 1.0:
+            v, v_fixed = 1.0, True
+        if not (-0.5 <= u <= 1.5 and -0.5 <= v <= 1.5):
+            # Diverged far away from this piece
+            return None
+        if abs(step[0]) < 1e-12 and abs(step[1]) < 1e-12:
+            break
+
+    param_tolerance = 1e-9
+    if not (-param_tolerance <= u <= 1.0 + param_tolerance):
+        return None
+    if not (-param_tolerance <= v <= 1.0 + param_tolerance):
+        return None
+    u = min(max(u, 0.0), 1.0)
+    v = min(max(v, 0.0), 1.0)
+
+    pt1 = _bezier_evaluate(points1, u)
+    pt2 = _bezier_evaluate(points2, v)
+    if np.linalg.norm(pt2 - pt1) < precision:
+        return u, v, 0.5 * (pt1 + pt2)
+    return None
+
+def _segment_parameter(point, p1, p2):
+    # Parameter of the point of segment p1 - p2 which is nearest to the given point
+    direction = p2 - p1
+    length2 = direction.dot(direction)
+    if length2 == 0.0:
+        return 0.0
+    return min(max((point - p1).dot(direction) / length2, 0.0), 1.0)
+
+def _intersect_bezier_lines(points1, points2, precision, u_clamp=(False, False), v_clamp=(False, False)):
+    # Both pieces are (nearly) straight line segments:
+    # solve linear equations for segments between end points,
+    # then refine the solution on actual curves
+    # (for degree 1 it is already exact).
+    p1, p2 = points1[0], points1[-1]
+    p3, p4 = points2[0], points2[-1]
+    direction1, direction2 = p2 - p1, p4 - p3
+    cross = np.linalg.norm(np.cross(direction1, direction2))
+    if cross <= 1e-9 * np.linalg.norm(direction1) * np.linalg.norm(direction2):
+        # Parallel (or degenerate) segments: linear equations have no unique
+        # solution, and segments can only touch or overlap. Then it is enough
+        # to check end points of each segment against the other segment.
+        candidates = [(0.0, _segment_parameter(p1, p3, p4)),
+                      (1.0, _segment_parameter(p2, p3, p4)),
+                      (_segment_parameter(p3, p1, p2), 0.0),
+                      (_segment_parameter(p4, p1, p2), 1.0)]
+        for u, v in candidates:
+            pt1 = _bezier_evaluate(points1, u)
+            pt2 = _bezier_evaluate(points2, v)
+            if np.linalg.norm(pt2 - pt1) < precision:
+                return u, v, 0.5 * (pt1 + pt2)
+        return None
+    matrix = np.stack((direction1, - direction2)).T
+    u, v = np.linalg.lstsq(matrix, p3 - p1, rcond=None)[0]
+    return _refine_bezier_intersection(points1, points2, precision, u=u, v=v,
+                u_clamp=u_clamp, v_clamp=v_clamp)
+
+def _bezier_decompose(curve):
+    # Split non-rational NURBS curve into Bezier segments in one pass
+    # (algorithm A5.6 from The NURBS Book). Unlike curve.to_bezier_segments(),
+    # this does not create intermediate curves, so it is linear in number of segments.
+    # Returns: list of control points of segments, and list of their T ranges.
+    degree = curve.get_degree()
+    knotvector = curve.get_knotvector()
+    control_points = curve.get_control_points()
+    if degree < 1 or not sv_knotvector.is_clamped(knotvector, degree) \
+            or sv_knotvector.check_multiplicity(degree, knotvector) is not None:
+        segments = curve.to_bezier_segments(to_bezier_class=False)
+        return [segment.get_control_points() for segment in segments], [segment.get_u_bounds() for segment in segments]
+
+    m = len(knotvector) - 1
+    a, b = degree, degree + 1
+    segment = control_points[:degree+1].copy()
+    points = []
+    bounds = []
+    while b < m:
+        i = b
+        while b < m and knotvector[b+1] == knotvector[b]:
+            b += 1
+        multiplicity = b - i + 1
+        next_segment = None
+        if b < m:
+            next_segment = np.empty_like(segment)
+            start = max(degree - multiplicity, 0)
+            next_segment[start:] = control_points[b-degree+start : b+1]
+        if multiplicity < degree:
+            # Insert knot U[b] until its multiplicity is equal to degree
+            numer = knotvector[b] - knotvector[a]
+            alphas = [numer / (knotvector[a+j] - knotvector[a]) for j in range(multiplicity+1, degree+1)]
+            r = degree - multiplicity
+            for j in range(1, r+1):
+                s = multiplicity + j
+                for k in range(degree, s-1, -1):
+                    alpha = alphas[k-s]
+                    segment[k] = alpha*segment[k] + (1.0 - alpha)*segment[k-1]
+                if next_segment is not None:
+                    next_segment[r-j] = segment[degree]
+        points.append(segment)
+        bounds.append((knotvector[a], knotvector[b]))
+        if next_segment is None:
+            break
+        segment = next_segment
+        a = b
+        b += 1
+    return points, bounds
+
+def _bezier_segments_bounds(points, bbox_tolerance):
+    # Control points of all segments are stacked into one contiguous array,
+    # so that bounding boxes of all segments are calculated at once.
+    counts = [len(pts) for pts in points]
+    offsets = np.cumsum([0] + counts[:-1])
+    all_points = np.concatenate(points)
+    d = 0.5 * bbox_tolerance
+    mins = np.minimum.reduceat(all_points, offsets, axis=0) - d
+    maxs = np.maximum.reduceat(all_points, offsets, axis=0) + d
+    return mins, maxs
+
+def _overlapping_segments(mins1, maxs1, mins2, maxs2):
+    # Generate pairs of indices (i, j), such that bounding box of i'th segment
+    # of the first curve intersects bounding box of j'th segment of the second curve.
+    # Segments of the second curve are sorted by minimum X coordinate, so for each
+    # segment of the first curve only a range of segments of the second curve is
+    # checked: ones which start before it ends along X, and after the last one
+    # which (together with all before it) ends before it starts. Memory usage is linear.
+    order = np.argsort(mins2[:, 0], kind='stable')
+    sorted_mins2 = mins2[order]
+    sorted_maxs2 = maxs2[order]
+    ends = np.searchsorted(sorted_mins2[:, 0], maxs1[:, 0], side='right')
+    starts = np.searchsorted(np.maximum.accumulate(sorted_maxs2[:, 0]), mins1[:, 0], side='left')
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        if start >= end:
+            continue
+        overlaps = np.logical_and(
+                        (mins1[i] <= sorted_maxs2[start:end]).all(axis=1),
+                        (sorted_mins2[start:end] <= maxs1[i]).all(axis=1))
+        for j in np.sort(order[start:end][overlaps]):
+            yield i, j
+
+def _can_intersect_as_bezier(curve):
+    return curve.get_degree() <= 3 and not curve.is_rational()
+
+def _enough_results(results, max_results):
+    return max_results is not None and len(results) >= max_results
+
+def _intersect_bezier_curves(curve1, curve2, numeric_precision=0.001, bbox_tolerance=1e-4, max_results=None):
+    # Same "recursive bounding box" algorithm as in intersect_nurbs_curves(),
+    # but for non-rational curves of low degree: each curve is split into
+    # Bezier segments once, and then subdivision is done directly on control
+    # polygons, with Newton refinement instead of generic numeric method.
+
+    THRESHOLD = 0.01
+
+    t1_range = curve1.get_u_bounds()
+    t2_range = curve2.get_u_bounds()
+    # The same intersection can be found in neighbouring pieces of curves
+    t1_tolerance = 1e-6 * (t1_range[1] - t1_range[0])
+    t2_tolerance = 1e-6 * (t2_range[1] - t2_range[0])
+
+    result = []
+
+    def _add(t1, t2, pt):
+        for t1_prev, t2_prev, _ in result:
+            if abs(t1 - t1_prev) <= t1_tolerance and abs(t2 - t2_prev) <= t2_tolerance:
+                return
+        result.append((t1, t2, pt))
+
+    def _intersect(points1, points2, c1_bounds, c2_bounds):
+        t1_min, t1_max = c1_bounds
+        t2_min, t2_max = c2_bounds
+
+        bbox1 = bounding_box(points1).increase(bbox_tolerance)
+        bbox2 = bounding_box(points2).increase(bbox_tolerance)
+        if not bbox1.intersects(bbox2):
+            return
+
+        is_leaf = bbox1.size() < THRESHOLD and bbox2.size() < THRESHOLD
+        is_linear = len(points1) == 2 and len(points2) == 2
+        if is_linear or is_leaf:
+            u_clamp = (abs(t1_min - t1_range[0]) <= t1_tolerance, abs(t1_max - t1_range[1]) <= t1_tolerance)
+            v_clamp = (abs(t2_min - t2_range[0]) <= t2_tolerance, abs(t2_max - t2_range[1]) <= t2_tolerance)
+            if is_linear or (_check_is_line_points(points1) and _check_is_line_points(points2)):
+                r = _intersect_bezier_lines(points1, points2, numeric_precision,
+                            u_clamp=u_clamp, v_clamp=v_clamp)
+            else:
+                r = _refine_bezier_intersection(points1, points2, numeric_precision,
+                            u_clamp=u_clamp, v_clamp=v_clamp)
+            if r is not None:
+                u, v, pt = r
+                t1 = (1-u)*t1_min + u*t1_max
+                t2 = (1-v)*t2_min + v*t2_max
+                _add(t1, t2, pt)
+            return
+
+        mid1 = (t1_min + t1_max) * 0.5
+        mid2 = (t2_min + t2_max) * 0.5
+
+        p11, p12 = _bezier_split(points1)
+        p21, p22 = _bezier_split(points2)
+
+        parts = [(p11,p21, (t1_min, mid1), (t2_min, mid2)),
+                 (p11,p22, (t1_min, mid1), (mid2, t2_max)),
+                 (p12,p21, (mid1, t1_max), (t2_min, mid2)),
+                 (p12,p22, (mid1, t1_max), (mid2, t2_max))]
+
+        for part in parts:
+            _intersect(*part)
+            if _enough_results(result, max_results):
+                return
+
+    points1, bounds1 = _bezier_decompose(curve1)
+    points2, bounds2 = _bezier_decompose(curve2)
+
+    mins1, maxs1 = _bezier_segments_bounds(points1, bbox_tolerance)
+    mins2, maxs2 = _bezier_segments_bounds(points2, bbox_tolerance)
+
+    for i, j in _overlapping_segments(mins1, maxs1, mins2, maxs2):
+        _intersect(points1[i], points2[j], bounds1[i], bounds2[j])
+        if _enough_results(result, max_results):
+            break
+    return result
+
+def intersect_nurbs_curves(curve1, curve2, method='SLSQP', numeric_precision=0.001, logger=None, max_results=None):
+    """
+    Find intersection points of two NURBS curves.
+    If max_results is specified, stop searching after that many
+    intersections are found.
+
+    Returns: list of tuples (t1, t2, point).
+    """
     if logger is None:
         logger = getLogger()
 
     bbox_tolerance = 1e-4
 
+    if _can_intersect_as_bezier(curve1) and _can_intersect_as_bezier(curve2):
+        return _intersect_bezier_curves(curve1, curve2,
+                    numeric_precision = numeric_precision,
+                    bbox_tolerance = bbox_tolerance,
+                    max_results = max_results)
+
     # "Recursive bounding box" algorithm:
     # * if bounding boxes of two curves do not intersect, then curves do not intersect
     # * Otherwise, split each curves in half, and check if bounding boxes of these halves intersect.
@@ -367,9 +700,13 @@ def intersect_nurbs_curves(curve1, curve2, method='SLSQP', numeric_precision=0.0
     # give us a simple way to calculate bounding box of the curve: it's a bounding box of curve's
     # control points.
 
+    # Results are collected into one list, so that search can be
+    # stopped as soon as max_results intersections are found.
+    result = []
+
     def _intersect(curve1, curve2, c1_bounds, c2_bounds):
         if curve1 is None or curve2 is None:
-            return []
+            return
 
         t1_min, t1_max = c1_bounds
         t2_min, t2_max = c2_bounds
@@ -379,13 +716,14 @@ def intersect_nurbs_curves(curve1, curve2, method='SLSQP', numeric_precision=0.0
         bbox1 = curve1.get_bounding_box().increase(bbox_tolerance)
         bbox2 = curve2.get_bounding_box().increase(bbox_tolerance)
         if not bbox1.intersects(bbox2):
-            return []
+            return
 
         THRESHOLD = 0.01
 
         if bbox1.size() < THRESHOLD and bbox2.size() < THRESHOLD:
         #if _check_is_line(curve1) and _check_is_line(curve2):
-            return _intersect_curves_equation(curve1, curve2, method=method, precision=numeric_precision)
+            result.extend(_intersect_curves_equation(curve1, curve2, method=method, precision=numeric_precision))
+            return
 
         mid1 = (t1_min + t1_max) * 0.5
         mid2 = (t2_min + t2_max) * 0.5
@@ -393,14 +731,20 @@ def intersect_nurbs_curves(curve1, curve2, method='SLSQP', numeric_precision=0.0
         c11,c12 = curve1.split_at(mid1)
         c21,c22 = curve2.split_at(mid2)
 
-        r1 = _intersect(c11,c21, (t1_min, mid1), (t2_min, mid2))
-        r2 = _intersect(c11,c22, (t1_min, mid1), (mid2, t2_max))
-        r3 = _intersect(c12,c21, (mid1, t1_max), (t2_min, mid2))
-        r4 = _intersect(c12,c22, (mid1, t1_max), (mid2, t2_max))
+        parts = [(c11,c21, (t1_min, mid1), (t2_min, mid2)),
+                 (c11,c22, (t1_min, mid1), (mid2, t2_max)),
+                 (c12,c21, (mid1, t1_max), (t2_min, mid2)),
+                 (c12,c22, (mid1, t1_max), (mid2, t2_max))]
 
-        return r1 + r2 + r3 + r4
+        for part in parts:
+            _intersect(*part)
+            if _enough_results(result, max_results):
+                return
     
-    return _intersect(curve1, curve2, curve1.get_u_bounds(), curve2.get_u_bounds())
+    _intersect(curve1, curve2, curve1.get_u_bounds(), curve2.get_u_bounds())
+    if max_results is not None:
+        return result[:max_results]
+    return result
 
 def remove_excessive_knots(curve, tolerance=1e-6):
     kv = curve.get_knotvector()